@@ -10,7 +10,7 @@
         Frequency_bands_presence: The normalised presence of each band analysed.
 """
 from scipy.fftpack import fftfreq
-from numpy import absolute, real
+from numpy import absolute, add, asarray, concatenate, cumsum, real, where
 
 def remove_noise(spectrum: list, noise_level: float) -> list:
     """ Remove any frequencies with an amplitude under a specified noise level.
@@ -19,7 +19,8 @@ def remove_noise(spectrum: list, noise_level: float) -> list:
             - spectrum: the spectrum to be perform noise reduction on.
             - noise_level: the min power bin values should have to not be removed.
     """
-    return list(map(lambda amp: 0 if amp < noise_level else amp, spectrum))
+    spectrum = asarray(spectrum)
+    return where(spectrum < noise_level, 0, spectrum)
 
 def normalize_dict(dictionary: dict, dict_sum: float) -> dict:
     """ Constrain dictionary values to continous range 0-1 based on the dictionary sum given.
@@ -33,11 +34,19 @@ def normalize_dict(dictionary: dict, dict_sum: float) -> dict:
 def get_band_power(spectrum: list, bands: dict) -> dict:
     """ Get the summed power of each frequency range provided by bands.
 
+        The spectrum is reduced to a prefix sum in one vectorized pass,
+        making each band's power a constant-time subtraction, rather than
+        a fresh slice summation per band.
+
         Args:
             - spectrum: the spectrum to be summed against.
             - bands: the bands to sum powers of.
     """
-    return {band: sum(spectrum[values[0]:values[1]])
+    spectrum = asarray(spectrum)
+    spectrum_length = len(spectrum)
+    prefix_sums = concatenate(([0], cumsum(spectrum)))
+    return {band: prefix_sums[min(values[1], spectrum_length)]
+                  - prefix_sums[min(values[0], spectrum_length)]
             for band, values in bands.items()}
 
 def frequency_bands(spectrum: list, bands: dict, sampling_rate: int) -> dict:
@@ -49,12 +58,31 @@ def frequency_bands(spectrum: list, bands: dict, sampling_rate: int) -> dict:
             - sampling_rate: sampling rate of signal used to create spectrum.
     """
     matched_bands = frequency_bands_to_bins(spectrum, bands, sampling_rate)
-    filtered_spectrum = real(remove_noise(spectrum, 5))
+    filtered_spectrum = remove_noise(real(asarray(spectrum)), 5)
     band_power = get_band_power(filtered_spectrum, matched_bands)
-    normalized_presence = normalize_dict(band_power, sum(filtered_spectrum))
+    normalized_presence = normalize_dict(band_power, filtered_spectrum.sum())
 
     return normalized_presence
 
+def frequency_bands_fast(spectrum: list, band_names: list, band_edges: list) -> dict:
+    """ Variant of frequency_bands for repeated calls against a fixed set of bands.
+
+        The bin locations of each band should be precomputed once (see
+        frequency_bands_to_bins) and flattened to [low_0, high_0, low_1, high_1, ...],
+        sorted by low bin. This lets every band power be summed in a single
+        add.reduceat pass over the spectrum, rather than a Python loop per band.
+
+        Args:
+            - spectrum: the spectrum to analyse.
+            - band_names: band names, ordered to match the band_edges pairs.
+            - band_edges: flat array of [low, high) bin index pairs, one pair per band.
+    """
+    filtered_spectrum = remove_noise(real(asarray(spectrum)), 5)
+    band_power = add.reduceat(filtered_spectrum, band_edges)[::2]
+    spectrum_sum = filtered_spectrum.sum()
+    return {name: power / spectrum_sum if spectrum_sum > 0 else 0
+            for name, power in zip(band_names, band_power)}
+
 def frequency_bands_to_bins(spectrum: list, bands: dict, sampling_rate: int) -> dict:
     """ In order to correctly analyse frequency bands, finds the equivalent frequency bin locations.
 
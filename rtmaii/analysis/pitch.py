@@ -93,7 +93,10 @@ def pitch_from_hps(spectrum: list, sampling_rate: int, max_harmonics: int) -> fl
             which can be computationally expensive.
 
     """
-    harmonic_spectrum = spectrum.copy()
+    if max_harmonics <= 2: # No harmonic products will be applied, skip the copy.
+        harmonic_spectrum = spectrum
+    else:
+        harmonic_spectrum = spectrum.copy()
 
     for harmonic_level in range(2, max_harmonics):
         # Downsample using anti-aliasing, = better results
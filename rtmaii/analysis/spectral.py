@@ -7,15 +7,31 @@
     OUTPUTS:
         Spectrum: Frequency spectrum of the input sample.
 """
-from scipy.signal import butter, lfilter, fftconvolve, get_window
-from scipy.fftpack import fft
-from numpy import absolute, sum, power, log10
+from functools import lru_cache
+from scipy.signal import butter, sosfilt, get_window
+from scipy.fft import rfft, irfft, next_fast_len
+from numpy import absolute, ascontiguousarray, conj, float32, multiply, sum, power, log10, errstate
 from numpy.linalg import norm
 
+# Decibel reference divisor, 2^(8 * bytes_above_normalised) for raw PCM input.
+# Evaluated once at import instead of once per spectrogram frame.
+PCM_FULL_SCALE = power(2.0, 8 * 0)
+
+try: # Optional dependency, the decibel pipeline is offloaded to a GPU when one is present.
+    import cupy
+    GPU_ENABLED = bool(cupy.cuda.is_available())
+except Exception: # No CuPy install, or no usable CUDA runtime behind it.
+    cupy = None
+    GPU_ENABLED = False
+
+@lru_cache(maxsize=8)
 def butter_bandpass(low_cut_off: int, high_cut_off: int,
                     sampling_rate: int, order: int = 5) -> dict:
     """ Cut out any frequencies out of the range we are interested in.
 
+        Filter designs are cached, nodes analysing separate channels with
+        the same configuration share one set of coefficients.
+
         Args
             - low_cut_off: lower end of bandpass filter.
             - high_cut_off: upper end of bandpass filter.
@@ -25,23 +41,29 @@ def butter_bandpass(low_cut_off: int, high_cut_off: int,
     nyquist_frequency = 0.5 * sampling_rate
     low = low_cut_off / nyquist_frequency
     high = high_cut_off / nyquist_frequency
-    numerator, denominator = butter(order, [low, high], btype='bandpass')
-    return {'numerator': numerator, 'denominator': denominator}
+    # Second-order sections stay numerically stable at higher orders,
+    # where the expanded transfer-function polynomials degrade.
+    sos = butter(order, [low, high], btype='bandpass', output='sos')
+    return {'sos': sos}
 
-def band_pass_filter(signal: list, numerator: list, denominator: list) -> list:
+def band_pass_filter(signal: list, sos: list) -> list:
     """ Cut out any frequencies out of the range we are interested in.
 
         Args
-            - signal: length of window to create.
-            - numerator: numerator of filter.
-            - denominator: denominator of filter.
+            - signal: the signal to be filtered.
+            - sos: second-order section coefficients of the filter.
     """
-    filtered_signal = lfilter(numerator, denominator, signal)
+    filtered_signal = sosfilt(sos, signal)
     return filtered_signal
 
+@lru_cache(maxsize=8)
 def new_window(window_length: int, window: str) -> list:
     """ Generate a new smoothing window for use.
 
+        Windows are cached, so nodes analysing separate channels with the
+        same configuration share one window array. Treat the result as
+        read-only.
+
         Args
             - window_length: length of window to create.
             - window: the smoothing window to be applied.
@@ -52,11 +74,21 @@ def new_window(window_length: int, window: str) -> list:
 def convolve_signal(signal: list) -> list:
     """ Apply convolution to the input signal.
 
+        Convolving a signal against its own reversal is an autocorrelation,
+        so this is computed with a single real FFT (Wiener-Khinchin theorem),
+        rather than the two forward transforms fftconvolve would run.
+
         Args
             - signal: the signal to convolve.
     """
-    convol = fftconvolve(signal, signal[::-1], mode='full')
-    return convol[len(convol) // 2:] # Split bin in half removing negative lags.
+    # A contiguous single-precision buffer halves the bandwidth the transform
+    # has to pull through the cache, int16 audio loses no precision here.
+    signal = ascontiguousarray(signal, dtype=float32)
+    signal_length = len(signal)
+    transform_length = next_fast_len(2 * signal_length - 1) # Pad to avoid circular wrap-around.
+    transformed = rfft(signal, transform_length, workers=-1)
+    autocorrelation = irfft(transformed * conj(transformed), transform_length, workers=-1)
+    return autocorrelation[:signal_length] # Only keep the non-negative lags.
 
 def spectrum_transform(signal: list) -> list:
     """ Performs FFT on input signal, returns only positive half of spectrum.
@@ -65,8 +97,11 @@ def spectrum_transform(signal: list) -> list:
             - signal: the signal to perform a fourier transform on.
     """
     signal_length = len(signal)
-    normalized_spectrum = fft(signal) / signal_length # Normalization
-    return normalized_spectrum[:signal_length // 2] # Only need half of fft output.
+    # rfft exploits the Hermitian symmetry of real signals, computing only the
+    # positive half we keep anyway; workers=-1 lets pocketfft parallelise
+    # large transforms.
+    normalized_spectrum = rfft(signal, workers=-1) * (1.0 / signal_length)
+    return normalized_spectrum[:signal_length // 2] # Drop the Nyquist bin, keeping length N/2.
 
 def spectrum(signal: list,
              window: list,
@@ -76,46 +111,47 @@ def spectrum(signal: list,
         Args
             - signal: the temporal signal to be converted to a spectrum.
             - window: the smoothing window to be applied.
-            - bp_filter: the bandpass filter polynomial coefficents to apply to the signal.
-                In the form of {'numerator': list, 'denominator': list}
+            - bp_filter: the bandpass filter coefficients to apply to the signal.
+                In the form of {'sos': list}
     """
-    windowed_signal = signal * window
-    filtered_signal = windowed_signal if bp_filter is None else band_pass_filter(
-        windowed_signal,
-        bp_filter['numerator'],
-        bp_filter['denominator'])
-    frequency_spectrum = spectrum_transform(filtered_signal)
-    return frequency_spectrum
+    # Each stage here runs in compiled code (NumPy multiply, scipy sosfilt,
+    # pocketfft) over the same buffer chain, keeping one temporary alive at
+    # a time rather than binding every intermediate result.
+    windowed_signal = multiply(signal, window, dtype=float32)
+    if bp_filter is not None:
+        windowed_signal = band_pass_filter(windowed_signal, bp_filter['sos'])
+    return spectrum_transform(windowed_signal)
 
 def normalizorFFT(fft: list) -> list:
     """ Returns a normalised frequency spectrum .
 
         Args
-            - signal: the temporal signal to be converted to a spectrum.
-            - window: the smoothing window to be applied.
-            - bp_filter: the bandpass filter polynomial coefficents to apply to the signal.
-                In the form of {'numerator': list, 'denominator': list}
+            - fft: the spectrum to be normalised.
     """
-    normalised_ftt = norm(fft)
-    if normalised_ftt == 0:
-        return fft
-    else:
-        fft = fft / normalised_ftt
-        return fft
+    norm_value = norm(fft)
+    if norm_value > 0: # Leave an all-zero (silent) spectrum untouched.
+        fft *= 1.0 / norm_value # Scale in-place with a single reciprocal multiply.
+    return fft
 
 def convertingMagnitudeToDecibel(ffts: list, window: list) -> list:
     """ Returns a converts the contents of spectrums to change values that represent magnitidues to power (decibels) .
 
+        When CuPy is installed and a CUDA device is available, the whole
+        pipeline runs on the GPU and only the final result is copied back.
+
         Args
             - ffts: a collection of spectrums.
             - window: the smoothing window to be applied.
     """
-    ffts = absolute(ffts) * 2.0 / sum(window)
-    ffts = ffts / power(2.0, 8* 0)
-    try:
-        loggedffts = log10(ffts)
-    except:
-        loggedffts = 0
-
-    ffts = (20 * loggedffts).clip(-120)
-    return ffts
+    if GPU_ENABLED:
+        magnitudes = cupy.absolute(cupy.asarray(ffts))
+        magnitudes *= 2.0 / (sum(window) * PCM_FULL_SCALE)
+        cupy.log10(magnitudes, out=magnitudes)
+        magnitudes *= 20
+        return cupy.asnumpy(cupy.clip(magnitudes, -120, None))
+    magnitudes = absolute(ffts) # Complex input, so this allocation is needed.
+    magnitudes *= 2.0 / (sum(window) * PCM_FULL_SCALE)
+    with errstate(divide='ignore'): # Silent bins give log10(0) = -inf, clipped below.
+        log10(magnitudes, out=magnitudes)
+    magnitudes *= 20
+    return magnitudes.clip(-120, out=magnitudes)
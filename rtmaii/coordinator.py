@@ -16,7 +16,7 @@ from rtmaii.workqueue import WorkQueue
 from rtmaii.analysis import spectral, bpm
 from pydispatch import dispatcher
 from scipy.signal import resample
-from numpy import mean, int16, pad, column_stack, arange
+from numpy import mean, int16, float16, pad, asarray, arange, ascontiguousarray
 
 LOGGER = logging.getLogger()
 class Coordinator(threading.Thread):
@@ -40,6 +40,7 @@ class Coordinator(threading.Thread):
         self.queue = WorkQueue(queue_length)
         self.peer_list = []
         self.config = config
+        self.running = True
         self.reset_attributes()
         self.start()
 
@@ -47,6 +48,15 @@ class Coordinator(threading.Thread):
         """ Executed after the thread is started, holds tasks for the thread to run. """
         raise NotImplementedError("Run should be implemented")
 
+    def stop(self):
+        """ Signal the coordinator's run loop to exit, releasing its thread.
+
+            A sentinel is queued to wake the loop if it is blocked waiting
+            for data; run loops skip None items before processing.
+        """
+        self.running = False
+        self.queue.put(None)
+
     def message_peers(self, data: object):
         """ Sends input data to each peered thread.
 
@@ -110,11 +120,16 @@ class RootCoordinator(Coordinator):
             4. (Optional): Average channel data, controlled by config.
             5. Send channel signals to peers.
         """
-        while True:
+        while self.running:
             signal = self.queue.get()
+            if signal is None:
+                continue
             signal = pad(signal, (0, self.frame_size - len(signal)), 'constant')
 
-            channel_signals = [signal[channel::self.channels] for channel in range(self.channels)]
+            # De-interleaving produces strided views, make each channel's signal
+            # contiguous once here rather than in every downstream transform.
+            channel_signals = [ascontiguousarray(signal[channel::self.channels])
+                               for channel in range(self.channels)]
 
             if self.merge_channels:
                 channel_signals = [mean(channel_signals, axis=0, dtype=int16)]
@@ -148,7 +163,7 @@ class FrequencyCoordinator(Coordinator):
 
     def run(self):
         """ Extend signal data to configured resolution before transmitting to peers. """
-        while True:
+        while self.running:
             data = self.queue.get_all()
             self.extended_signal.extend(data)
             self.extended_signal = self.extended_signal[-self.frequency_resolution:]
@@ -181,8 +196,10 @@ class SpectrumCoordinator(Coordinator):
 
     def run(self):
         """ Convert input signal into it's frequency spectrum equivalent. """
-        while True:
+        while self.running:
             signal = self.queue.get()
+            if signal is None:
+                continue
             frequency_spectrum = spectral.spectrum(signal, self.window, self.filter)
             self.message_peers(frequency_spectrum)
             dispatcher.send(signal='spectrum', sender=self.channel_id, data=frequency_spectrum)
@@ -208,17 +225,18 @@ class FFTSCoordinator(Coordinator):
     """
 
     def __init__(self, **kwargs: dict):
-        """ Reset object attributes, to latest config values. """
         Coordinator.__init__(self, kwargs['config'], kwargs['channel_id'])
+
+    def reset_attributes(self):
+        """ Reset object attributes, to latest config values. """
         frame_size = self.config.get_config('frames_per_sample')
         self.window = spectral.new_window(frame_size, 'hanning')
         self.spectrogram_resolution = 128
         self.timer = 0
 
     def run(self):
-        """ Reset object attributes, to latest config values. """
         ffts = []
-        while True:
+        while self.running:
 
             fft = self.queue.get()
             if fft is not None:
@@ -247,29 +265,39 @@ class SpectrogramCoordinator(Coordinator):
     """
     def __init__(self, **kwargs: dict):
         Coordinator.__init__(self, kwargs['config'], kwargs['channel_id'])
-        frame_size = self.config.get_config('frames_per_sample')
-        self.window = frame_size
 
     def reset_attributes(self):
+        """ Reset object attributes, to latest config values.
+
+            The time and frequency axes only depend on configuration, so they
+            are computed once here rather than for every spectrogram.
+        """
         self.sampling_rate = self.config.get_config('sampling_rate')
+        self.window = self.config.get_config('frames_per_sample')
+        self.stime = arange(0, 128, dtype=float) * self.window / self.sampling_rate / 2
+        frequecy = arange(0, self.window / 2, dtype=float) * self.sampling_rate / self.window
+        group_count = (len(frequecy) // 4) * 4
+        self.smallerfreq = frequecy[:group_count].reshape(group_count // 4, 4).mean(axis=1)
 
     def run(self):
-        while True:
-            ffts = self.queue.get()
-            ffts = column_stack(ffts)
+        while self.running:
+            # Only the newest spectrogram batch matters, drop any backlog so a
+            # slow consumer can't starve behind stale data.
+            ffts = self.queue.get_latest()
+            if ffts is None:
+                continue
+            # One copy into an array, then a free transpose view, instead of
+            # column_stack building the transposed layout element by element.
+            ffts = asarray(ffts).T
             ffts = spectral.convertingMagnitudeToDecibel(ffts, self.window)
-            stime = arange(0, 128, dtype=float) * self.window / self.sampling_rate / 2
-            frequecy = arange(0, self.window / 2, dtype=float) * self.sampling_rate / self.window
-            smallerffts = []
-            smallerfreq = []
-            for i in range(0, len(ffts), 4):
-                if i + 4 > len(ffts) and len(smallerffts) == 128:
-                    break
-                meanfreq = (frequecy[i] + frequecy[i+1] + frequecy[i + 2] + frequecy[i + 3])
-                meanffts = (ffts[i] + ffts[i+1] + ffts[i+2] + ffts[i+3])/4
-                smallerffts.append(meanffts)
-                smallerfreq.append(meanfreq)
-            spectrodata = [stime, smallerfreq, smallerffts]
+            # Downsample by averaging each group of 4 rows in one vectorized
+            # reduction, truncating any rows that don't fill a full group.
+            group_count = (len(ffts) // 4) * 4
+            smallerffts = ffts[:group_count].reshape(group_count // 4, 4, -1).mean(axis=1)
+            # Half-precision is ample for decibel intensities and halves the
+            # size of everything downstream (queues, CNN feed, exports).
+            smallerffts = smallerffts.astype(float16)
+            spectrodata = [self.stime, self.smallerfreq, smallerffts]
 
             self.message_peers(spectrodata)
             dispatcher.send(signal='spectogramData', sender=self.channel_id, data=spectrodata)
@@ -299,9 +327,11 @@ class BPMCoordinator(Coordinator):
         self.filter = bpm.lowpass(self.low_cut, self.low_pass, self.sampling_rate)
 
     def run(self):
-        while True:
+        while self.running:
             self.threshold -= self.descrate
             rawdata = self.queue.get()
+            if rawdata is None:
+                continue
             data = bpm.applylowpass(rawdata, self.filter['num'], self.filter['denom'])
             beat = bpm.beatdetection(data, self.threshold)
             if beat != False:
@@ -337,8 +367,10 @@ class EnergyBPMCoordinator(Coordinator):
         self.threshold = 0
 
     def run(self):
-        while True:
+        while self.running:
             data = self.queue.get()
+            if data is None:
+                continue
             #as soon as there is enough energy history, start the analysis
             newamp = bpm.getrmsamp(data)
             if len(self.energyhistory) >= 43:
@@ -1,34 +1,34 @@
 import threading
 import os
 from rtmaii.workqueue import WorkQueue
-import _pickle as cPickle
-from pydispatch import dispatcher
 import pickle
 
 
 class Exporter(threading.Thread):
     """ Exporter responsible for creating an output file that users can use for future spectrogram data.
 
+        Spectrograms are buffered and appended to an open binary log in batches,
+        rather than re-pickling everything received so far on every new sample.
+        Each pickle.load on the output file yields one batch of spectrograms.
+
         Attributes:
             - queue (WorkQueue): Queue for incoming spectrograms data
-            - spectrumCollection (list): Stores received spectrograms for export
+            - flush_interval (int): Batch size to buffer before appending to the log.
     """
 
-    def __init__(self, queue_length: int = 1):
+    def __init__(self, queue_length: int = 1, flush_interval: int = 16):
         threading.Thread.__init__(self, args=(), kwargs=None)
         self.queue = WorkQueue(queue_length)
+        self.flush_interval = flush_interval
         self.setDaemon(True)
         self.start()
-        self.spectrumCollection = []
 
     def run(self):
-        while True:
-            spectrumData = self.queue.get()
-            self.spectrumCollection.append(spectrumData)
-            with open(os.path.join(os.path.dirname(__file__),'../CNN/save.p'), "wb")  as output_file:  
-                pickle.dump(self.spectrumCollection, output_file)
-            
-    
-        
-
-
+        batch = []
+        with open(os.path.join(os.path.dirname(__file__), '../CNN/save.p'), "ab") as output_file:
+            while True:
+                batch.append(self.queue.get())
+                if len(batch) >= self.flush_interval:
+                    pickle.dump(batch, output_file)
+                    output_file.flush()
+                    batch = []
@@ -53,6 +53,12 @@ class Hierarchy(object):
             being analysed and initial creation of the hierarchy.
         """
         LOGGER.debug('Creating new hierarchy.')
+        if hasattr(self, 'root'): # Release threads of a previous hierarchy before rebuilding.
+            self.root['thread'].stop()
+            for channel in self.root['channels']:
+                for _, node in channel.items():
+                    if 'thread' in node:
+                        node['thread'].stop()
         self.root = {
             'channels': []
         }
@@ -249,6 +255,7 @@ class Hierarchy(object):
                     self.root['channels'][channel][parent]['thread'].remove_peer(node['thread'])
 
                 del self.root['channels'][channel][node_id]
+                node['thread'].stop() # Release the node's thread.
 
                 LOGGER.debug('Removed node %s from channel hierarchy %d', node_id, channel)
             else:
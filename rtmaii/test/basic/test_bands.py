@@ -53,6 +53,20 @@ class TestSuite(unittest.TestCase):
         bands = frequency.frequency_bands(spectrum, {'full_range': [2, 3]}, len(spectrum) * 2)
         self.assertEqual(bands['full_range'], 1)
 
+    def test_frequency_bands_fast(self):
+        """ Test that the precomputed edge variant matches frequency_bands. """
+        spectrum = zeros(100) # Start with empty array
+        spectrum[2] = 100 # Set low band to have all the power.
+        spectrum[50] = 100 # Set high band to have the remaining power.
+        interested_bands = {'low': [2, 3], 'high': [50, 51]}
+        expected = frequency.frequency_bands(spectrum, interested_bands, len(spectrum) * 2)
+        matched_bands = frequency.frequency_bands_to_bins(spectrum, interested_bands,
+                                                          len(spectrum) * 2)
+        names = list(matched_bands)
+        edges = [edge for name in names for edge in matched_bands[name]]
+        bands = frequency.frequency_bands_fast(spectrum, names, edges)
+        self.assertEqual(expected, bands)
+
     def test_frequency_bands_to_bins(self):
         """ Tests that the frequency bins points are correctly found. """
         spectrum = arange(0, 102, 1)
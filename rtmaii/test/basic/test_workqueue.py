@@ -0,0 +1,42 @@
+""" WORKQUEUE MODULE TESTS
+
+    - Any tests against the workqueue datastructure will be contained here.
+"""
+import unittest
+from rtmaii.workqueue import WorkQueue
+
+class TestSuite(unittest.TestCase):
+    """ Test Suite for the workqueue module. """
+
+    def setUp(self):
+        """ Perform setup of initial parameters. """
+        self.queue = WorkQueue(5)
+        for item in range(5):
+            self.queue.put(item)
+
+    def test_get(self):
+        """ Test that items are retrieved in insertion order. """
+        self.assertEqual(self.queue.get(), 0)
+        self.assertEqual(self.queue.get(), 1)
+
+    def test_bounded_length(self):
+        """ Test that old items are culled once the queue limit is reached. """
+        self.queue.put(5)
+        self.assertEqual(self.queue.get(), 1)
+
+    def test_get_latest(self):
+        """ Test that only the newest item is kept, discarding the backlog. """
+        self.assertEqual(self.queue.get_latest(), 4)
+        self.assertFalse(self.queue.queue)
+
+    def test_get_nowait(self):
+        """ Test that the newest item is returned without blocking when empty. """
+        self.assertEqual(self.queue.get_nowait(), 4)
+        self.assertEqual(self.queue.get_nowait(), None)
+
+    def test_get_all(self):
+        """ Test that all queued items are returned in one call. """
+        queue = WorkQueue(5)
+        queue.put([1, 2])
+        queue.put([3, 4])
+        self.assertEqual(queue.get_all(), [1, 2, 3, 4])
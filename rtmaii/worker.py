@@ -16,10 +16,29 @@ from rtmaii.workqueue import WorkQueue
 from scipy.signal import resample
 from rtmaii.analysis import frequency, pitch, key, spectral, bpm
 from pydispatch import dispatcher
-from numpy import reshape, array
+from numpy import reshape, array, empty
 from tensorflow.contrib import predictor
 
 LOGGER = logging.getLogger()
+
+_PREDICTOR_LOCK = threading.Lock()
+_PREDICTOR_CACHE = {}
+
+def load_predictor(model_dir: str) -> object:
+    """ Load the predict function of a TensorFlow SavedModel.
+
+        Loaded models are cached, so workers analysing separate channels
+        share a single in-memory model rather than re-reading the
+        SavedModel from disk per worker instance.
+
+        Args:
+            - model_dir: directory containing the SavedModel.
+    """
+    with _PREDICTOR_LOCK:
+        if model_dir not in _PREDICTOR_CACHE:
+            _PREDICTOR_CACHE[model_dir] = predictor.from_saved_model(model_dir)
+        return _PREDICTOR_CACHE[model_dir]
+
 class Worker(threading.Thread):
     """ Base worker class, responsible for initializing shared attributes.
 
@@ -37,12 +56,22 @@ class Worker(threading.Thread):
         self.config = config
         self.channel_id = channel_id
         self.setDaemon(True)
+        self.running = True
         self.reset_attributes()
         self.start()
 
     def run(self):
         raise NotImplementedError("Run should be implemented")
 
+    def stop(self):
+        """ Signal the worker's run loop to exit, releasing its thread.
+
+            A sentinel is queued to wake the loop if it is blocked waiting
+            for data; run loops skip None items before processing.
+        """
+        self.running = False
+        self.queue.put(None)
+
     def reset_attributes(self):
         """ Inherited method, used for resetting any attributes on configuration changes. """
         pass
@@ -63,7 +92,7 @@ class GenrePredictorWorker(Worker):
         Worker.__init__(self, kwargs['config'], kwargs['channel_id'])
         self.exporter = exporter
         
-        self.predict_fn = predictor.from_saved_model(os.path.join(os.path.dirname(__file__), 'model'))
+        self.predict_fn = load_predictor(os.path.join(os.path.dirname(__file__), 'model'))
         self.accuracyChecker = []
         self.genredict = {}
         self.genredict[0] = 'Rock'
@@ -73,31 +102,35 @@ class GenrePredictorWorker(Worker):
         self.prediction = 'N/A'
 
     def run(self):
-        
-        while True:
+
+        while self.running:
             spectrogram = self.queue.get()
-            spectrodata = spectrogram[2]
-            testphoto = array(spectrodata)
-            testphoto = testphoto.astype('float32')   
-            
+            if spectrogram is None:
+                continue
+            spectrograms = [spectrogram]
+            while self.queue.queue: # Batch any backlog into a single inference call.
+                backlog = self.queue.get()
+                if backlog is not None:
+                    spectrograms.append(backlog)
+
             try:
-                testphoto = reshape(testphoto, (1,128,128,1))
-                predictions = self.predict_fn({'x': testphoto})
-                predictionclass = predictions['classes'][0]
-                self.prediction = self.genredict[predictionclass]
-                self.accuracyChecker.append(self.prediction)
-               
-                if(len(self.accuracyChecker) > 3):
-                    self.accuracyChecker.pop(0)
-                    print(self.accuracyChecker)
-                    self.prediction = max(set(self.accuracyChecker), key=self.accuracyChecker.count)
-
-                export_data = [spectrodata,self.prediction]
-                self.exporter.queue.put(export_data)
+                testphotos = array([spectrogram[2] for spectrogram in spectrograms])
+                testphotos = testphotos.astype('float32')
+                testphotos = reshape(testphotos, (len(spectrograms), 128, 128, 1))
+                predictions = self.predict_fn({'x': testphotos})
+
+                for spectrogram, predictionclass in zip(spectrograms, predictions['classes']):
+                    self.prediction = self.genredict[predictionclass]
+                    self.accuracyChecker.append(self.prediction)
+
+                    if(len(self.accuracyChecker) > 3):
+                        self.accuracyChecker.pop(0)
+                        self.prediction = max(set(self.accuracyChecker), key=self.accuracyChecker.count)
+
+                    export_data = [spectrogram[2], self.prediction]
+                    self.exporter.queue.put(export_data)
             except:
                 pass
-            
-            spectrogram = []
 
             dispatcher.send(signal='genre', sender=self.channel_id, data=self.prediction)
 
@@ -111,6 +144,8 @@ class BandsWorker(Worker):
         Attributes:
             - bands_of_interest: dictionary of frequency bands to analyse.
             - sampling_rate: sampling_rate of source being analysed.
+            - band_names: band names ordered by their start bin.
+            - band_edges: precomputed [low, high) bin index pairs for each band.
     """
     def __init__(self, **kwargs: dict):
         Worker.__init__(self, kwargs['config'], kwargs['channel_id'])
@@ -118,13 +153,24 @@ class BandsWorker(Worker):
     def reset_attributes(self):
         self.bands_of_interest = self.config.get_config('bands')
         self.sampling_rate = self.config.get_config('sampling_rate')
+        # Bin locations only depend on the spectrum length and sampling rate,
+        # so they can be precomputed here rather than on every frame.
+        spectrum_length = self.config.get_config('block_size') // 2
+        matched_bands = frequency.frequency_bands_to_bins(empty(spectrum_length),
+                                                          self.bands_of_interest,
+                                                          self.sampling_rate)
+        ordered_bands = sorted(matched_bands.items(), key=lambda band: band[1][0])
+        self.band_names = [name for name, _ in ordered_bands]
+        self.band_edges = array([edge for _, edges in ordered_bands for edge in edges])
 
     def run(self):
-        while True:
+        while self.running:
             spectrum = self.queue.get()
-            frequency_bands = frequency.frequency_bands(spectrum,
-                                                        self.bands_of_interest,
-                                                        self.sampling_rate)
+            if spectrum is None:
+                continue
+            frequency_bands = frequency.frequency_bands_fast(spectrum,
+                                                             self.band_names,
+                                                             self.band_edges)
             dispatcher.send(signal='bands', sender=self.channel_id, data=frequency_bands)
 
 class Key(object):
@@ -167,8 +213,10 @@ class ZeroCrossingWorker(Worker, Key):
         self.sampling_rate = self.config.get_config('sampling_rate')
 
     def run(self):
-        while True:
+        while self.running:
             signal = self.queue.get()
+            if signal is None:
+                continue
             estimated_pitch = pitch.pitch_from_zero_crossings(signal, self.sampling_rate)
             dispatcher.send(signal='pitch', sender=self.channel_id, data=estimated_pitch)
             self.analyse_note(estimated_pitch, self.channel_id)
@@ -190,8 +238,10 @@ class AutoCorrelationWorker(Worker, Key):
         self.sampling_rate = self.config.get_config('sampling_rate')
 
     def run(self):
-        while True:
+        while self.running:
             signal = self.queue.get()
+            if signal is None:
+                continue
             convolved_signal = spectral.convolve_signal(signal)
             estimated_pitch = pitch.pitch_from_auto_correlation(convolved_signal,
                                                                 self.sampling_rate)
@@ -215,8 +265,10 @@ class HPSWorker(Worker, Key):
         self.sampling_rate = self.config.get_config('sampling_rate')
 
     def run(self):
-        while True:
+        while self.running:
             spectrum = self.queue.get()
+            if spectrum is None:
+                continue
             estimated_pitch = pitch.pitch_from_hps(spectrum, self.sampling_rate, 7)
             dispatcher.send(signal='pitch', sender=self.channel_id, data=estimated_pitch)
             self.analyse_note(estimated_pitch, self.channel_id)
@@ -238,8 +290,10 @@ class FFTWorker(Worker, Key):
         self.sampling_rate = self.config.get_config('sampling_rate')
 
     def run(self):
-        while True:
+        while self.running:
             spectrum = self.queue.get()
+            if spectrum is None:
+                continue
             estimated_pitch = pitch.pitch_from_fft(spectrum, self.sampling_rate)
             dispatcher.send(signal='pitch', sender=self.channel_id, data=estimated_pitch)
             self.analyse_note(estimated_pitch, self.channel_id)
@@ -268,8 +322,10 @@ class BPMWorker(Worker):
         Worker.__init__(self, kwargs['config'], kwargs['channel_id'])
 
     def run(self):
-        while True:
+        while self.running:
             data = self.queue.get()
+            if data is None:
+                continue
             beats = data[0]
             if(len(data)>1):
                 hbeats = data[1]
@@ -34,6 +34,29 @@ class WorkQueue(object):
         data = self.queue.popleft()
         return data
 
+    def get_latest(self) -> object:
+        """ Get the most recently added item, discarding any older backlog.
+
+            If the queue is empty this blocks until an item is available.
+        """
+        if not self.queue: # Wait until a notification is sent.
+            with self.condition:
+                self.condition.wait()
+        data = self.queue.popleft()
+        while self.queue: # Drop any stale items, keeping only the newest.
+            data = self.queue.popleft()
+        return data
+
+    def get_nowait(self) -> object:
+        """ Get the most recently added item without blocking, discarding any older backlog.
+
+            Returns None if the queue is empty.
+        """
+        data = None
+        while self.queue:
+            data = self.queue.popleft()
+        return data
+
     def get_all(self) -> list:
         """ Get all items currently present in work queue extending the original object.
 
@@ -43,8 +66,10 @@ class WorkQueue(object):
         if not self.queue: # Wait until a notification is sent.
             with self.condition:
                 self.condition.wait()
-        while self.queue: # Grab all items.
-            data.extend(self.queue.popleft())
+        while self.queue: # Grab all items, skipping any wake-up sentinels.
+            item = self.queue.popleft()
+            if item is not None:
+                data.extend(item)
         return data
 
     def put(self, data: object):